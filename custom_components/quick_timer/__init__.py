@@ -1,8 +1,15 @@
 """Quick Timer - Schedule one-time actions for any entity."""
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import heapq
+import json
 import logging
+import re
 from datetime import timedelta
+from functools import lru_cache
+from itertools import count
 from typing import Any
 
 import voluptuous as vol
@@ -19,9 +26,8 @@ from homeassistant.core import (
     callback,
 )
 from homeassistant.helpers import config_validation as cv
-from homeassistant.helpers.event import (
-    async_track_point_in_time,
-)
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.util import dt as dt_util
 from homeassistant.util import slugify
@@ -71,7 +77,25 @@ PLATFORMS = ["sensor"]
 # Allow configuration via configuration.yaml (optional)
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
-# Service schemas
+# Accepts HH:MM and HH:MM:SS for absolute-time scheduling
+_AT_TIME_RE = re.compile(r"^(\d{1,2}):(\d{2})(?::(\d{2}))?$")
+
+# Frozensets let vol.In short-circuit membership checks instead of scanning a list
+_TIME_UNITS = frozenset({UNIT_SECONDS, UNIT_MINUTES, UNIT_HOURS})
+_TIME_MODES = frozenset({TIME_MODE_RELATIVE, TIME_MODE_ABSOLUTE})
+
+# Legacy action aliases -> service suffix; anything else passes through as-is
+_LEGACY_ACTION = {
+    "on": "turn_on",
+    "turn_on": "turn_on",
+    "off": "turn_off",
+    "turn_off": "turn_off",
+    "toggle": "toggle",
+}
+
+# Service schemas — compiled once at import time and reused for every call.
+# Internal paths (task restore) call the coordinator directly and never
+# re-validate through these schemas.
 RUN_ACTION_SCHEMA = vol.Schema(
     {
         vol.Optional(ATTR_TASK_ID): cv.string,  # Unique ID for scoped tasks
@@ -79,7 +103,7 @@ RUN_ACTION_SCHEMA = vol.Schema(
         vol.Optional(ATTR_DELAY): vol.All(
             vol.Coerce(int), vol.Range(min=1, max=86400)
         ),
-        vol.Optional(ATTR_UNIT, default=UNIT_MINUTES): vol.In([UNIT_SECONDS, UNIT_MINUTES, UNIT_HOURS]),
+        vol.Optional(ATTR_UNIT, default=UNIT_MINUTES): vol.In(_TIME_UNITS),
         vol.Optional(ATTR_TASK_LABEL): cv.string,  # Human-readable label for overview
         vol.Optional(ATTR_START_ACTIONS): vol.All(cv.ensure_list, [dict]),  # Execute on start (optional)
         vol.Optional(ATTR_FINISH_ACTIONS): vol.All(cv.ensure_list, [dict]),  # Execute on finish (required, optional for legacy)
@@ -88,7 +112,7 @@ RUN_ACTION_SCHEMA = vol.Schema(
         vol.Optional(ATTR_NOTIFY_MOBILE, default=False): cv.boolean,
         vol.Optional(ATTR_NOTIFY_DEVICES): vol.All(cv.ensure_list, [cv.string]),
         vol.Optional(ATTR_AT_TIME): cv.string,  # HH:MM format for absolute time
-        vol.Optional(ATTR_TIME_MODE, default=TIME_MODE_RELATIVE): vol.In([TIME_MODE_RELATIVE, TIME_MODE_ABSOLUTE]),
+        vol.Optional(ATTR_TIME_MODE, default=TIME_MODE_RELATIVE): vol.In(_TIME_MODES),
         # Legacy fields for backward compatibility
         vol.Optional(ATTR_ACTION): cv.string,
         vol.Optional(ATTR_SERVICE): cv.string,
@@ -98,6 +122,15 @@ RUN_ACTION_SCHEMA = vol.Schema(
 )
 
 
+@lru_cache(maxsize=512)
+def _split_service(service: str) -> tuple[str, str] | None:
+    """Split a 'domain.service' string once; cached since actions repeat."""
+    if "." not in service:
+        return None
+    domain, _, name = service.partition(".")
+    return domain, name
+
+
 def convert_to_seconds(delay: int, unit: str) -> int:
     """Convert delay to seconds based on unit."""
     if unit == UNIT_SECONDS:
@@ -129,6 +162,31 @@ SET_PREFERENCES_SCHEMA = vol.Schema(
 )
 
 
+class _TaskHandle:
+    """Lightweight in-memory record for one scheduled task.
+
+    Keeps the deadline together with the metadata the cancel path needs,
+    so cancellation doesn't have to re-fetch the task from storage. `when`
+    (loop-monotonic seconds) also identifies the task's live heap entry:
+    a heap entry whose timestamp no longer matches is stale and skipped.
+    """
+
+    __slots__ = ("when", "finish_actions", "notify_flags", "task_label")
+
+    def __init__(
+        self,
+        when: float,
+        finish_actions: list[dict[str, Any]],
+        notify_flags: tuple[bool, bool, list[str] | None],
+        task_label: str | None,
+    ) -> None:
+        self.when = when
+        self.finish_actions = finish_actions
+        # (notify_ha, notify_mobile, notify_devices)
+        self.notify_flags = notify_flags
+        self.task_label = task_label
+
+
 class QuickTimerCoordinator:
     """Coordinator for Quick Timer."""
 
@@ -141,6 +199,53 @@ class QuickTimerCoordinator:
         self._state_listeners: dict[str, Any] = {}
         self._sensor: Any = None
 
+        # Cache registry handles once; the per-call async_get lookups and
+        # full entity scans in the notification path add up on big installs.
+        self._dev_registry = dr.async_get(hass)
+        self._ent_registry = er.async_get(hass)
+        # device_id -> notify entity_id, built lazily on first use and
+        # dropped whenever either registry changes.
+        self._notify_entity_by_device: dict[str, str] = {}
+        self._notify_index_valid = False
+        # device_id -> slugified device name, for legacy service-name guesses
+        self._device_slug_cache: dict[str, str] = {}
+        # Running counter for persistent notification ids
+        self._notif_counter = 0
+        # Shared scheduler: all deadlines live in one min-heap and a single
+        # loop timer is armed for the nearest one. Entries are
+        # (when, seq, task_id); seq keeps comparisons away from task_ids.
+        self._heap: list[tuple[float, int, str]] = []
+        self._heap_seq = count()
+        self._next_timer: asyncio.TimerHandle | None = None
+        hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED, self._invalidate_notify_index
+        )
+        hass.bus.async_listen(
+            dr.EVENT_DEVICE_REGISTRY_UPDATED, self._invalidate_notify_index
+        )
+
+    @callback
+    def _invalidate_notify_index(self, _event) -> None:
+        """Drop the device -> notify entity map after a registry change."""
+        self._notify_entity_by_device = {}
+        self._notify_index_valid = False
+        self._device_slug_cache.clear()
+
+    def _get_notify_entity_map(self) -> dict[str, str]:
+        """Return the device_id -> notify entity_id map, rebuilding if stale."""
+        if not self._notify_index_valid:
+            index: dict[str, str] = {}
+            for entry in self._ent_registry.entities.values():
+                if (
+                    entry.domain == "notify"
+                    and entry.device_id
+                    and entry.disabled_by is None
+                ):
+                    index.setdefault(entry.device_id, entry.entity_id)
+            self._notify_entity_by_device = index
+            self._notify_index_valid = True
+        return self._notify_entity_by_device
+
     def register_sensor(self, sensor) -> None:
         """Register the monitoring sensor."""
         self._sensor = sensor
@@ -160,14 +265,20 @@ class QuickTimerCoordinator:
     @callback
     def _update_sensor(self) -> None:
         """Update the sensor with current tasks."""
-        if self._sensor is not None:
-            self._sensor.update_tasks(self.store.get_all_tasks())
+        # Bail before snapshotting the store — these run on every task
+        # mutation, including restore before the platform is set up
+        sensor = self._sensor
+        if sensor is None:
+            return
+        sensor.update_tasks(self.store.get_all_tasks())
 
     @callback
     def _update_preferences_sensor(self) -> None:
         """Update the sensor with current preferences."""
-        if self._sensor is not None:
-            self._sensor.update_preferences(self.preferences_store.get_all_preferences())
+        sensor = self._sensor
+        if sensor is None:
+            return
+        sensor.update_preferences(self.preferences_store.get_all_preferences())
 
     async def async_schedule_action(
         self,
@@ -188,29 +299,40 @@ class QuickTimerCoordinator:
         # Cancel any existing task with this ID
         await self.async_cancel_action(task_id, silent=True)
 
+        # Normalize once; the store entry, the task handle and the event
+        # payloads all share these list references instead of re-allocating
+        # defensive copies. Event listeners must not mutate them.
+        start_actions = start_actions or []
+        notify_devices = notify_devices or []
+
         now = dt_util.now()
         
         # Calculate scheduled time based on mode
         if time_mode == TIME_MODE_ABSOLUTE and at_time:
             # Parse absolute time (HH:MM or HH:MM:SS format)
-            try:
-                parts = at_time.split(':')
-                hours, minutes = int(parts[0]), int(parts[1])
-                seconds = int(parts[2]) if len(parts) > 2 else 0
-                scheduled_time = now.replace(hour=hours, minute=minutes, second=seconds, microsecond=0)
-                
-                # Handle crossing midnight - if the time is in the past, schedule for tomorrow
-                if scheduled_time <= now:
-                    scheduled_time = scheduled_time + timedelta(days=1)
-                    _LOGGER.info(
-                        "Scheduled time %s is in the past, scheduling for tomorrow",
-                        at_time,
-                    )
-                
-                delay_seconds = int((scheduled_time - now).total_seconds())
-            except (ValueError, AttributeError) as err:
-                _LOGGER.error("Invalid at_time format '%s': %s", at_time, err)
+            match = _AT_TIME_RE.match(at_time)
+            if match is None:
+                _LOGGER.error("Invalid at_time format '%s': expected HH:MM or HH:MM:SS", at_time)
+                return
+            hours = int(match.group(1))
+            minutes = int(match.group(2))
+            seconds = int(match.group(3) or 0)
+            if hours > 23 or minutes > 59 or seconds > 59:
+                _LOGGER.error("Invalid at_time value '%s': out of range", at_time)
                 return
+
+            # Seconds-of-day arithmetic instead of datetime.replace/timedelta;
+            # crossing midnight just wraps by a day
+            delay_seconds = (hours * 3600 + minutes * 60 + seconds) - (
+                now.hour * 3600 + now.minute * 60 + now.second
+            )
+            if delay_seconds <= 0:
+                delay_seconds += 86400
+                _LOGGER.info(
+                    "Scheduled time %s is in the past, scheduling for tomorrow",
+                    at_time,
+                )
+            scheduled_time = now + timedelta(seconds=delay_seconds)
         else:
             # Relative time mode (original behavior)
             delay_seconds = convert_to_seconds(delay, unit)
@@ -219,54 +341,86 @@ class QuickTimerCoordinator:
         scheduled_time_str = now.isoformat()
         end_time_str = scheduled_time.isoformat()
 
-        # Execute start actions immediately (if any)
+        # Execute start actions immediately (if any). Actions run in order by
+        # default; consecutive actions flagged "parallel" are gathered so
+        # independent targets don't serialize.
         if start_actions:
             _LOGGER.info("Executing %d start actions for task %s", len(start_actions), task_id)
-            for idx, action_def in enumerate(start_actions):
+
+            async def _run_start_action(idx: int, action_def: dict[str, Any]) -> None:
                 try:
                     await self._execute_action_definition(action_def)
                 except Exception as err:
                     _LOGGER.error("Start action %d failed for task %s: %s", idx, task_id, err)
 
-        # Store the task
-        await self.store.async_add_task(
+            pending: list = []
+            for idx, action_def in enumerate(start_actions):
+                if action_def.get("parallel"):
+                    pending.append(_run_start_action(idx, action_def))
+                    continue
+                if pending:
+                    await asyncio.gather(*pending)
+                    pending = []
+                await _run_start_action(idx, action_def)
+            if pending:
+                await asyncio.gather(*pending)
+
+        # Store the task and the history entry together — they hit two
+        # independent stores, so the saves can overlap instead of running
+        # back to back.
+        store_coro = self.store.async_add_task(
             task_id=task_id,
             scheduled_time=scheduled_time_str,
             end_time=end_time_str,
             delay_seconds=delay_seconds,
-            start_actions=start_actions or [],
+            start_actions=start_actions,
             finish_actions=finish_actions,
             notify=notify,
             notify_ha=notify_ha,
             notify_mobile=notify_mobile,
-            notify_devices=notify_devices or [],
+            notify_devices=notify_devices,
             at_time=at_time,
             time_mode=time_mode,
             task_label=task_label,
+            end_ts=scheduled_time.timestamp(),
+            start_ts=now.timestamp(),
         )
+        if finish_actions:
+            # History entry is keyed by the primary target entity
+            primary_entity = finish_actions[0].get("target", {}).get("entity_id", task_id)
+            await asyncio.gather(
+                store_coro,
+                self.preferences_store.async_add_to_history(
+                    primary_entity,
+                    {
+                        "delay": delay,
+                        "unit": unit,
+                        "time_mode": time_mode,
+                        "at_time": at_time,
+                        "start_actions": start_actions,
+                        "finish_actions": finish_actions,
+                    },
+                ),
+            )
+            self._update_preferences_sensor()
+        else:
+            await store_coro
 
         # Schedule the finish actions
-        cancel_callback = async_track_point_in_time(
-            self.hass,
-            self._create_finish_actions_callback(
-                task_id=task_id,
-                finish_actions=finish_actions,
-                notify=notify,
-                notify_ha=notify_ha,
-                notify_mobile=notify_mobile,
-                notify_devices=notify_devices,
-                task_label=task_label,
-            ),
-            scheduled_time,
+        self._async_schedule_finish(
+            task_id,
+            delay_seconds,
+            finish_actions,
+            (notify_ha or notify, notify_mobile, notify_devices),
+            task_label,
         )
-        self._scheduled_tasks[task_id] = cancel_callback
 
         # Fire event
         self.hass.bus.async_fire(
             EVENT_TASK_STARTED,
             {
                 "task_id": task_id,
-                "start_actions": start_actions or [],
+                "start_actions": start_actions,
                 "finish_actions": finish_actions,
                 "scheduled_time": scheduled_time_str,
                 "end_time": end_time_str,
@@ -274,22 +428,6 @@ class QuickTimerCoordinator:
             },
         )
 
-        # Add history entry for the primary target entity
-        if finish_actions:
-            primary_entity = finish_actions[0].get("target", {}).get("entity_id", task_id)
-            await self.preferences_store.async_add_to_history(
-                primary_entity,
-                {
-                    "delay": delay,
-                    "unit": unit,
-                    "time_mode": time_mode,
-                    "at_time": at_time,
-                    "start_actions": start_actions or [],
-                    "finish_actions": finish_actions,
-                },
-            )
-            self._update_preferences_sensor()
-
         # Update sensor
         self._update_sensor()
 
@@ -316,6 +454,115 @@ class QuickTimerCoordinator:
             time_mode,
         )
 
+    def _async_schedule_finish(
+        self,
+        task_id: str,
+        delay_seconds: float,
+        finish_actions: list[dict[str, Any]],
+        notify_flags: tuple[bool, bool, list[str] | None],
+        task_label: str | None,
+    ) -> None:
+        """Register the task's deadline with the shared heap scheduler.
+
+        N pending timers cost one armed TimerHandle instead of N: deadlines
+        go into a min-heap and only the nearest one is scheduled on the
+        event loop. Cancellations just drop the _TaskHandle; the matching
+        heap entry goes stale and is skipped when it surfaces.
+        """
+        when = self.hass.loop.time() + delay_seconds
+        self._scheduled_tasks[task_id] = _TaskHandle(
+            when, finish_actions, notify_flags, task_label
+        )
+        heapq.heappush(self._heap, (when, next(self._heap_seq), task_id))
+        self._arm_next()
+
+    def _arm_next(self) -> None:
+        """(Re)arm the single loop timer for the nearest live deadline."""
+        if self._next_timer is not None:
+            self._next_timer.cancel()
+            self._next_timer = None
+        heap = self._heap
+        while heap:
+            when, _, task_id = heap[0]
+            handle = self._scheduled_tasks.get(task_id)
+            if handle is None or handle.when != when:
+                # Stale entry from a cancellation or reschedule
+                heapq.heappop(heap)
+                continue
+            self._next_timer = self.hass.loop.call_at(when, self._fire_due)
+            return
+
+    @callback
+    def _fire_due(self) -> None:
+        """Dispatch every task whose deadline has passed, then re-arm."""
+        self._next_timer = None
+        now = self.hass.loop.time()
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            when, _, task_id = heapq.heappop(heap)
+            handle = self._scheduled_tasks.get(task_id)
+            if handle is None or handle.when != when:
+                continue
+            self.hass.async_create_task(self._async_fire_finish(task_id))
+        self._arm_next()
+
+    async def _async_fire_finish(self, task_id: str) -> None:
+        """Execute a due task's finish actions using its in-memory handle."""
+        handle = self._scheduled_tasks.get(task_id)
+        if handle is None:
+            _LOGGER.debug("Finish fired for unknown task %s, ignoring", task_id)
+            return
+
+        finish_actions = handle.finish_actions
+        notify_ha, notify_mobile, notify_devices = handle.notify_flags
+        display_name = handle.task_label or task_id
+
+        _LOGGER.info("Executing %d finish actions for task %s", len(finish_actions), task_id)
+
+        success_count = 0
+        error_count = 0
+
+        for idx, action_def in enumerate(finish_actions):
+            try:
+                await self._execute_action_definition(action_def)
+                success_count += 1
+            except Exception as err:
+                _LOGGER.error("Finish action %d failed for task %s: %s", idx, task_id, err)
+                error_count += 1
+
+        # Fire completion event
+        self.hass.bus.async_fire(
+            EVENT_TASK_COMPLETED,
+            {
+                "task_id": task_id,
+                "finish_actions": finish_actions,
+                "success_count": success_count,
+                "error_count": error_count,
+            },
+        )
+
+        # Send notification if enabled
+        if notify_ha or notify_mobile or notify_devices:
+            if error_count > 0:
+                await self._send_notification(
+                    f"Timer Completed: {display_name}",
+                    f"{success_count} actions succeeded, {error_count} failed",
+                    notify_ha=notify_ha,
+                    notify_mobile=notify_mobile,
+                    notify_devices=notify_devices,
+                )
+            else:
+                await self._send_notification(
+                    f"Timer Completed: {display_name}",
+                    f"All {success_count} actions executed successfully",
+                    notify_ha=notify_ha,
+                    notify_mobile=notify_mobile,
+                    notify_devices=notify_devices,
+                )
+
+        # Clean up
+        await self._cleanup_task(task_id)
+
     async def _execute_action_definition(self, action_def: dict[str, Any]) -> None:
         """Execute a single action definition from an action array.
         
@@ -330,11 +577,11 @@ class QuickTimerCoordinator:
         data = action_def.get("data", {})
 
         # Parse service
-        if "." in service:
-            domain, service_name = service.split(".", 1)
-        else:
+        parsed = _split_service(service)
+        if parsed is None:
             _LOGGER.error("Invalid service format '%s': must be 'domain.service'", service)
             return
+        domain, service_name = parsed
 
         try:
             await self.hass.services.async_call(
@@ -385,13 +632,19 @@ class QuickTimerCoordinator:
         service_data: dict | None = None,
     ) -> None:
         """Execute an action/service on an entity (universal)."""
-        call_data = dict(service_data) if service_data else {}
-        call_data[ATTR_ENTITY_ID] = entity_id
+        # No throwaway dict copy when service_data is empty; the re-assignment
+        # keeps the explicit entity_id winning over one inside service_data,
+        # matching the previous dict(service_data) + assignment behavior
+        call_data = {ATTR_ENTITY_ID: entity_id}
+        if service_data:
+            call_data.update(service_data)
+            call_data[ATTR_ENTITY_ID] = entity_id
 
         if service:
             # Universal mode: "domain.service_name" or just "service_name"
-            if "." in service:
-                svc_domain, svc_name = service.split(".", 1)
+            parsed = _split_service(service)
+            if parsed is not None:
+                svc_domain, svc_name = parsed
             else:
                 svc_domain = entity_id.split(".")[0]
                 svc_name = service
@@ -427,79 +680,15 @@ class QuickTimerCoordinator:
         else:
             return f"{delay} minutes"
 
-    def _create_finish_actions_callback(
-        self,
-        task_id: str,
-        finish_actions: list[dict[str, Any]],
-        notify: bool = False,
-        notify_ha: bool = False,
-        notify_mobile: bool = False,
-        notify_devices: list[str] | None = None,
-        task_label: str | None = None,
-    ):
-        """Create a callback for executing finish actions when timer completes."""
-        display_name = task_label or task_id
-
-        async def execute_finish_actions(now) -> None:
-            """Execute all finish actions."""
-            _LOGGER.info("Executing %d finish actions for task %s", len(finish_actions), task_id)
-
-            success_count = 0
-            error_count = 0
-
-            for idx, action_def in enumerate(finish_actions):
-                try:
-                    await self._execute_action_definition(action_def)
-                    success_count += 1
-                except Exception as err:
-                    _LOGGER.error("Finish action %d failed for task %s: %s", idx, task_id, err)
-                    error_count += 1
-
-            # Fire completion event
-            self.hass.bus.async_fire(
-                EVENT_TASK_COMPLETED,
-                {
-                    "task_id": task_id,
-                    "finish_actions": finish_actions,
-                    "success_count": success_count,
-                    "error_count": error_count,
-                },
-            )
-
-            # Send notification if enabled
-            if notify_ha or notify_mobile or notify_devices:
-                if error_count > 0:
-                    await self._send_notification(
-                        f"Timer Completed: {display_name}",
-                        f"{success_count} actions succeeded, {error_count} failed",
-                        notify_ha=notify_ha,
-                        notify_mobile=notify_mobile,
-                        notify_devices=notify_devices,
-                    )
-                else:
-                    await self._send_notification(
-                        f"Timer Completed: {display_name}",
-                        f"All {success_count} actions executed successfully",
-                        notify_ha=notify_ha,
-                        notify_mobile=notify_mobile,
-                        notify_devices=notify_devices,
-                    )
-
-            # Clean up
-            await self._cleanup_task(task_id)
-
-        return execute_finish_actions
-
     async def _cleanup_task(self, task_id: str) -> None:
         """Clean up a completed or cancelled task."""
-        # Remove from scheduled tasks
-        if task_id in self._scheduled_tasks:
-            del self._scheduled_tasks[task_id]
+        # Remove from scheduled tasks (single lookup via pop)
+        self._scheduled_tasks.pop(task_id, None)
 
         # Remove state listener (if any)
-        if task_id in self._state_listeners:
-            self._state_listeners[task_id]()
-            del self._state_listeners[task_id]
+        unsub = self._state_listeners.pop(task_id, None)
+        if unsub:
+            unsub()
 
         # Remove from store
         await self.store.async_remove_task(task_id)
@@ -513,18 +702,18 @@ class QuickTimerCoordinator:
         Used during HA shutdown/restart to stop callbacks while preserving
         stored tasks for restoration after restart.
         """
-        # Cancel all scheduled callbacks
-        for entity_id in list(self._scheduled_tasks.keys()):
-            try:
-                self._scheduled_tasks[entity_id]()
-            except Exception:  # noqa: BLE001
-                pass
+        # One timer to cancel and two containers to clear — the heap
+        # scheduler keeps no per-task callbacks
+        if self._next_timer is not None:
+            self._next_timer.cancel()
+            self._next_timer = None
+        self._heap.clear()
         self._scheduled_tasks.clear()
 
         # Remove all state listeners
-        for entity_id in list(self._state_listeners.keys()):
+        for unsub in self._state_listeners.values():
             try:
-                self._state_listeners[entity_id]()
+                unsub()
             except Exception:  # noqa: BLE001
                 pass
         self._state_listeners.clear()
@@ -535,16 +724,26 @@ class QuickTimerCoordinator:
         self, task_id: str, silent: bool = False, reason: str = "user_request"
     ) -> bool:
         """Cancel a scheduled task."""
-        if task_id not in self._scheduled_tasks and not self.store.has_task(task_id):
+        # pop up front: one lookup for the common live-task case, and the
+        # store is only consulted when no in-memory handle exists
+        handle = self._scheduled_tasks.pop(task_id, None)
+        if handle is None and not self.store.has_task(task_id):
             if not silent:
                 _LOGGER.debug("No scheduled task found for %s", task_id)
             return False
 
-        # Cancel the scheduled callback
-        if task_id in self._scheduled_tasks:
-            self._scheduled_tasks[task_id]()
-
-        task = self.store.get_task(task_id)
+        if handle is not None:
+            # Dropping the handle is the cancellation: the heap entry is now
+            # stale and will be skipped. The handle carries everything the
+            # notification below needs, skipping a store lookup.
+            notify_ha, notify_mobile, notify_devices = handle.notify_flags
+            task_label = handle.task_label
+        else:
+            task = self.store.get_task(task_id) or {}
+            notify_ha = task.get("notify_ha", task.get("notify", False))
+            notify_mobile = task.get("notify_mobile", False)
+            notify_devices = task.get("notify_devices")
+            task_label = task.get("task_label")
 
         # Clean up
         await self._cleanup_task(task_id)
@@ -558,14 +757,14 @@ class QuickTimerCoordinator:
             },
         )
 
-        if not silent and task and (task.get("notify_ha", False) or task.get("notify_mobile", False) or task.get("notify", False) or task.get("notify_devices")):
-            display_name = task.get("task_label") or task_id
+        if not silent and (notify_ha or notify_mobile or notify_devices):
+            display_name = task_label or task_id
             await self._send_notification(
                 f"Timer Cancelled: {display_name}",
                 f"Scheduled task was cancelled ({reason})",
-                notify_ha=task.get("notify_ha", task.get("notify", False)),
-                notify_mobile=task.get("notify_mobile", False),
-                notify_devices=task.get("notify_devices"),
+                notify_ha=notify_ha,
+                notify_mobile=notify_mobile,
+                notify_devices=notify_devices,
             )
 
         _LOGGER.info("Cancelled scheduled task %s (reason: %s)", task_id, reason)
@@ -580,20 +779,24 @@ class QuickTimerCoordinator:
         notify_devices: list[str] | None = None,
     ) -> None:
         """Send notifications (HA persistent and/or mobile push)."""
-        # HA Persistent Notification
+        # HA Persistent Notification — fire-and-forget so the caller (e.g.
+        # the finish-actions callback) isn't blocked on the service call
         if notify_ha:
-            try:
-                await self.hass.services.async_call(
+            # Monotonic counter instead of hash(title + message): no string
+            # concatenation/hashing, and no collisions overwriting entries.
+            self._notif_counter += 1
+            task = self.hass.async_create_task(
+                self.hass.services.async_call(
                     "persistent_notification",
                     "create",
                     {
                         "title": title,
                         "message": message,
-                        "notification_id": f"quick_timer_{hash(title + message) % 10000}",
+                        "notification_id": f"quick_timer_{self._notif_counter & 0xFFFF}",
                     },
                 )
-            except Exception as err:
-                _LOGGER.warning("Failed to send HA notification: %s", err)
+            )
+            task.add_done_callback(self._log_ha_notification_result)
 
         # Mobile Push Notification — specific devices or all
         if notify_devices:
@@ -601,6 +804,25 @@ class QuickTimerCoordinator:
         elif notify_mobile:
             await self._send_mobile_notification(title, message)
 
+    def _notify_services(self) -> dict[str, Any]:
+        """Return the registered notify services without a full snapshot.
+
+        async_services() copies every domain's service dict; the
+        domain-scoped accessor avoids that.
+        """
+        services = self.hass.services
+        if hasattr(services, "async_services_for_domain"):
+            return services.async_services_for_domain("notify")
+        # Older cores lack the domain accessor; read the internal mapping
+        # instead of paying for the all-domains copy.
+        return services._services.get("notify", {})  # noqa: SLF001
+
+    @staticmethod
+    def _log_ha_notification_result(task: asyncio.Task) -> None:
+        """Log failures from the fire-and-forget persistent notification."""
+        if not task.cancelled() and task.exception() is not None:
+            _LOGGER.warning("Failed to send HA notification: %s", task.exception())
+
     async def _send_mobile_notification(
         self, title: str, message: str, device_ids: list[str] | None = None
     ) -> None:
@@ -613,9 +835,6 @@ class QuickTimerCoordinator:
         Broadcast mode iterates all registered notify.mobile_app_* services.
         """
         try:
-            from homeassistant.helpers import device_registry as dr
-            from homeassistant.helpers import entity_registry as er
-
             notify_data = {
                 "title": title,
                 "message": message,
@@ -624,132 +843,166 @@ class QuickTimerCoordinator:
 
             # ── 1. Targeted: specific device_ids selected ──
             if device_ids:
-                dev_registry = dr.async_get(self.hass)
-                ent_registry = er.async_get(self.hass)
-
-                for device_id in device_ids:
-                    device = dev_registry.async_get(device_id)
-                    if not device:
-                        _LOGGER.warning("Device %s not found in registry", device_id)
-                        continue
-
-                    # Strategy A: Find a notify entity for this device
-                    notify_entity_id = None
-                    for entry in ent_registry.entities.values():
-                        if (
-                            entry.domain == "notify"
-                            and entry.device_id == device_id
-                            and entry.disabled_by is None
-                        ):
-                            notify_entity_id = entry.entity_id
-                            break
-
-                    if notify_entity_id:
-                        try:
-                            await self.hass.services.async_call(
-                                "notify",
-                                "send_message",
-                                {"message": message, "title": title},
-                                target={"entity_id": notify_entity_id},
-                            )
-                            _LOGGER.info(
-                                "Notification sent via entity %s (device %s)",
-                                notify_entity_id, device.name,
-                            )
-                            continue
-                        except Exception as e:
-                            _LOGGER.warning(
-                                "send_message to %s failed: %s, trying fallback service",
-                                notify_entity_id, e,
-                            )
-
-                    # Strategy B: Guess service name from device name / identifier
-                    service_candidates = []
-
-                    if device.name:
-                        safe_name = slugify(device.name)
-                        service_candidates.append(f"mobile_app_{safe_name}")
-                        service_candidates.append(f"mobile_app_{safe_name.replace('-', '_')}")
-
-                    for id_domain, identifier in device.identifiers:
-                        if id_domain == "mobile_app":
-                            service_candidates.append(f"mobile_app_{identifier}")
-
-                    service_called = False
-                    for service_name in service_candidates:
-                        if self.hass.services.has_service("notify", service_name):
-                            try:
-                                await self.hass.services.async_call(
-                                    "notify", service_name, notify_data
-                                )
-                                _LOGGER.info(
-                                    "Notification sent via service notify.%s (device %s)",
-                                    service_name, device.name,
-                                )
-                                service_called = True
-                                break
-                            except Exception as e:
-                                _LOGGER.error(
-                                    "Service notify.%s failed: %s", service_name, e
-                                )
-
-                    if not service_called:
+                notify_entity_map = self._get_notify_entity_map()
+                # One snapshot of the registered notify services for the whole
+                # batch; candidates below are checked by set membership.
+                notify_services = set(self._notify_services())
+
+                # Each device's push is independent — fan out concurrently
+                # instead of awaiting them one after the other.
+                results = await asyncio.gather(
+                    *(
+                        self._async_notify_device(
+                            device_id,
+                            title,
+                            message,
+                            notify_data,
+                            notify_entity_map,
+                            notify_services,
+                        )
+                        for device_id in device_ids
+                    ),
+                    return_exceptions=True,
+                )
+                for device_id, result in zip(device_ids, results):
+                    if isinstance(result, Exception):
                         _LOGGER.error(
-                            "Could not send notification to device %s (%s): "
-                            "No matching notify entity or mobile_app_* service found. "
-                            "Checked services: %s",
-                            device_id, device.name, service_candidates,
+                            "Notification to device %s failed: %s", device_id, result
                         )
 
             # ── 2. Broadcast: send to all mobile_app devices ──
             else:
-                services = self.hass.services.async_services()
-                notify_services = services.get("notify", {})
-
-                sent_count = 0
-                for service_name in notify_services:
-                    if service_name.startswith("mobile_app_"):
-                        try:
-                            await self.hass.services.async_call(
+                # Prefer one notify.send_message call targeting every notify
+                # entity; only fall back to iterating legacy mobile_app_*
+                # services when no notify entities are registered.
+                all_notify_entities = list(self._get_notify_entity_map().values())
+                if all_notify_entities:
+                    try:
+                        await self.hass.services.async_call(
+                            "notify",
+                            "send_message",
+                            {"message": message, "title": title},
+                            target={"entity_id": all_notify_entities},
+                        )
+                        _LOGGER.info(
+                            "Broadcast via send_message to %d entities",
+                            len(all_notify_entities),
+                        )
+                    except Exception as e:
+                        _LOGGER.error("Entity-based broadcast failed: %s", e)
+                else:
+                    targets = [
+                        service_name
+                        for service_name in self._notify_services()
+                        if service_name.startswith("mobile_app_")
+                    ]
+                    results = await asyncio.gather(
+                        *(
+                            self.hass.services.async_call(
                                 "notify", service_name, notify_data
                             )
-                            sent_count += 1
-                        except Exception as e:
+                            for service_name in targets
+                        ),
+                        return_exceptions=True,
+                    )
+                    sent_count = 0
+                    for service_name, result in zip(targets, results):
+                        if isinstance(result, Exception):
                             _LOGGER.warning(
-                                "Broadcast to notify.%s failed: %s", service_name, e
+                                "Broadcast to notify.%s failed: %s", service_name, result
                             )
+                        else:
+                            sent_count += 1
 
-                if sent_count == 0:
-                    # Fallback: try entity-based broadcast
-                    _LOGGER.warning("No mobile_app_* services found, trying entity-based broadcast")
-                    ent_registry = er.async_get(self.hass)
-                    all_notify_entities = [
-                        entry.entity_id
-                        for entry in ent_registry.entities.values()
-                        if entry.domain == "notify"
-                        and entry.disabled_by is None
-                        and entry.device_id
-                    ]
-                    if all_notify_entities:
-                        try:
-                            await self.hass.services.async_call(
-                                "notify",
-                                "send_message",
-                                {"message": message, "title": title},
-                                target={"entity_id": all_notify_entities},
-                            )
-                            _LOGGER.info(
-                                "Broadcast via send_message to %d entities",
-                                len(all_notify_entities),
-                            )
-                        except Exception as e:
-                            _LOGGER.error("Entity-based broadcast failed: %s", e)
-                    else:
+                    if sent_count == 0:
                         _LOGGER.error("No notify entities or services found for broadcast")
 
         except Exception as err:
+            # Traceback formatting is expensive when notifications fail in a
+            # loop; only pay for it when debug logging is on.
             _LOGGER.error(
-                "Failed to send mobile notification: %s", err, exc_info=True
+                "Failed to send mobile notification: %s: %s",
+                type(err).__name__,
+                err,
+                exc_info=_LOGGER.isEnabledFor(logging.DEBUG),
+            )
+
+    async def _async_notify_device(
+        self,
+        device_id: str,
+        title: str,
+        message: str,
+        notify_data: dict[str, Any],
+        notify_entity_map: dict[str, str],
+        notify_services: set[str],
+    ) -> None:
+        """Send one device's push notification (entity first, legacy fallback)."""
+        device = self._dev_registry.async_get(device_id)
+        if not device:
+            _LOGGER.warning("Device %s not found in registry", device_id)
+            return
+
+        # Strategy A: Find a notify entity for this device
+        notify_entity_id = notify_entity_map.get(device_id)
+
+        if notify_entity_id:
+            try:
+                await self.hass.services.async_call(
+                    "notify",
+                    "send_message",
+                    {"message": message, "title": title},
+                    target={"entity_id": notify_entity_id},
+                )
+                _LOGGER.info(
+                    "Notification sent via entity %s (device %s)",
+                    notify_entity_id, device.name,
+                )
+                return
+            except Exception as e:
+                _LOGGER.warning(
+                    "send_message to %s failed: %s, trying fallback service",
+                    notify_entity_id, e,
+                )
+
+        # Strategy B: Guess service name from device name / identifier
+        service_candidates = []
+
+        if device.name:
+            safe_name = self._device_slug_cache.get(device_id)
+            if safe_name is None:
+                safe_name = slugify(device.name)
+                self._device_slug_cache[device_id] = safe_name
+            service_candidates.append(f"mobile_app_{safe_name}")
+            service_candidates.append(f"mobile_app_{safe_name.replace('-', '_')}")
+
+        for id_domain, identifier in device.identifiers:
+            if id_domain == "mobile_app":
+                service_candidates.append(f"mobile_app_{identifier}")
+
+        service_called = False
+        for service_name in service_candidates:
+            if service_name in notify_services:
+                try:
+                    await self.hass.services.async_call(
+                        "notify", service_name, notify_data
+                    )
+                    _LOGGER.info(
+                        "Notification sent via service notify.%s (device %s)",
+                        service_name, device.name,
+                    )
+                    service_called = True
+                    break
+                except Exception as e:
+                    _LOGGER.error(
+                        "Service notify.%s failed: %s", service_name, e
+                    )
+
+        if not service_called:
+            _LOGGER.error(
+                "Could not send notification to device %s (%s): "
+                "No matching notify entity or mobile_app_* service found. "
+                "Checked services: %s",
+                device_id, device.name, service_candidates,
             )
 
     async def async_restore_tasks(self) -> None:
@@ -774,75 +1027,85 @@ class QuickTimerCoordinator:
 
             if scheduled_time <= now:
                 # Task should have already executed, execute it now
-                _LOGGER.info(
+                _LOGGER.debug(
                     "Executing missed task %s (was scheduled for %s)",
                     task_id,
                     end_time_str,
                 )
-                callback_fn = self._create_finish_actions_callback(
-                    task_id=task_id,
-                    finish_actions=finish_actions,
-                    notify=task.get("notify", False),
-                    notify_ha=task.get("notify_ha", False),
-                    notify_mobile=task.get("notify_mobile", False),
-                    notify_devices=task.get("notify_devices"),
-                    task_label=task.get("task_label"),
+                # Register an already-due handle so the shared finish path
+                # can pick up the task's parameters, then run it inline
+                self._scheduled_tasks[task_id] = _TaskHandle(
+                    self.hass.loop.time(),
+                    finish_actions,
+                    (
+                        task.get("notify_ha", task.get("notify", False)),
+                        task.get("notify_mobile", False),
+                        task.get("notify_devices"),
+                    ),
+                    task.get("task_label"),
                 )
-                await callback_fn(now)
+                await self._async_fire_finish(task_id)
             else:
                 # Reschedule the task
-                _LOGGER.info(
+                _LOGGER.debug(
                     "Restoring scheduled task %s at %s",
                     task_id,
                     end_time_str,
                 )
-                cancel_callback = async_track_point_in_time(
-                    self.hass,
-                    self._create_finish_actions_callback(
-                        task_id=task_id,
-                        finish_actions=finish_actions,
-                        notify=task.get("notify", False),
-                        notify_ha=task.get("notify_ha", False),
-                        notify_mobile=task.get("notify_mobile", False),
-                        notify_devices=task.get("notify_devices"),
-                        task_label=task.get("task_label"),
+                self._async_schedule_finish(
+                    task_id,
+                    (scheduled_time - now).total_seconds(),
+                    finish_actions,
+                    (
+                        task.get("notify_ha", task.get("notify", False)),
+                        task.get("notify_mobile", False),
+                        task.get("notify_devices"),
                     ),
-                    scheduled_time,
+                    task.get("task_label"),
                 )
-                self._scheduled_tasks[task_id] = cancel_callback
 
         self._update_sensor()
 
 
-async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
-    """Set up the Quick Timer component."""
-    hass.data.setdefault(DOMAIN, {})
-    
+async def _async_get_or_create_coordinator(hass: HomeAssistant) -> QuickTimerCoordinator:
+    """Return the shared coordinator, creating and restoring it on first use.
+
+    Memoized on hass.data so the yaml and config-entry setup paths share
+    one set of stores and only load them from disk once.
+    """
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    coordinator = domain_data.get("coordinator")
+    if coordinator is not None:
+        return coordinator
+
     # Initialize storage early so services work
     store = QuickTimerStore(hass)
     await store.async_load()
-    
+
     # Initialize preferences storage
     preferences_store = QuickTimerPreferencesStore(hass)
     await preferences_store.async_load()
-    
-    # Create coordinator
+
     coordinator = QuickTimerCoordinator(hass, store, preferences_store)
-    hass.data[DOMAIN]["coordinator"] = coordinator
-    hass.data[DOMAIN]["store"] = store
-    hass.data[DOMAIN]["preferences_store"] = preferences_store
-    
+    domain_data["coordinator"] = coordinator
+    domain_data["store"] = store
+    domain_data["preferences_store"] = preferences_store
+
     # Restore tasks from storage
     await coordinator.async_restore_tasks()
-    
-    # Register services immediately so they are available
+    return coordinator
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the Quick Timer component."""
+    coordinator = await _async_get_or_create_coordinator(hass)
+
+    # Register services immediately so they are available. Handlers close
+    # over the coordinator created above — no per-call hass.data lookup.
+    coord = coordinator
+
     async def handle_run_action(call: ServiceCall) -> None:
         """Handle the run_action service call."""
-        coord = hass.data[DOMAIN].get("coordinator")
-        if coord is None:
-            _LOGGER.error("Quick Timer coordinator not initialized")
-            return
-
         # New architecture: task_id + start_actions + finish_actions
         task_id = call.data.get(ATTR_TASK_ID)
         entity_id = call.data.get(ATTR_ENTITY_ID)
@@ -878,16 +1141,9 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
             if service:
                 finish_service = service
             elif action:
-                # Map legacy action to service
-                domain = entity_id.split(".")[0]
-                if action in ("on", "turn_on"):
-                    finish_service = f"{domain}.turn_on"
-                elif action in ("off", "turn_off"):
-                    finish_service = f"{domain}.turn_off"
-                elif action == "toggle":
-                    finish_service = f"{domain}.toggle"
-                else:
-                    finish_service = f"{domain}.{action}"
+                # Map legacy action to service via one dict lookup
+                domain = entity_id.partition(".")[0]
+                finish_service = f"{domain}.{_LEGACY_ACTION.get(action, action)}"
             else:
                 _LOGGER.error("No valid action or service provided")
                 return
@@ -904,7 +1160,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
                 start_actions = finish_actions  # Execute immediately
                 # For reverse, just turn off (simplified)
                 finish_actions = [{
-                    "service": f"{entity_id.split('.')[0]}.turn_off",
+                    "service": f"{entity_id.partition('.')[0]}.turn_off",
                     "target": {"entity_id": entity_id},
                     "data": {},
                 }]
@@ -914,10 +1170,16 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
             if entity_id:
                 task_id = entity_id
             else:
-                # Generate task_id from finish_actions
-                import hashlib
-                task_str = str(finish_actions)
-                task_id = f"task_{hashlib.md5(task_str.encode()).hexdigest()[:8]}"
+                # Generate task_id from finish_actions. Canonical JSON plus a
+                # 4-byte blake2b digest beats md5 over str(dict) and stays
+                # stable across Python versions.
+                digest = hashlib.blake2b(
+                    json.dumps(
+                        finish_actions, sort_keys=True, separators=(",", ":")
+                    ).encode(),
+                    digest_size=4,
+                ).hexdigest()
+                task_id = f"task_{digest}"
 
         await coord.async_schedule_action(
             task_id=task_id,
@@ -936,11 +1198,6 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
     async def handle_cancel_action(call: ServiceCall) -> None:
         """Handle the cancel_action service call."""
-        coord = hass.data[DOMAIN].get("coordinator")
-        if coord is None:
-            _LOGGER.error("Quick Timer coordinator not initialized")
-            return
-            
         task_id = call.data.get(ATTR_TASK_ID)
         entity_id = call.data.get(ATTR_ENTITY_ID)
         
@@ -956,11 +1213,6 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
     async def handle_get_preferences(call: ServiceCall) -> dict:
         """Handle the get_preferences service call."""
-        coord = hass.data[DOMAIN].get("coordinator")
-        if coord is None:
-            _LOGGER.error("Quick Timer coordinator not initialized")
-            return {}
-        
         entity_id = call.data.get(ATTR_ENTITY_ID)
         if entity_id:
             return coord.preferences_store.get_preferences(entity_id)
@@ -969,22 +1221,16 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
     async def handle_set_preferences(call: ServiceCall) -> None:
         """Handle the set_preferences service call."""
-        coord = hass.data[DOMAIN].get("coordinator")
-        if coord is None:
-            _LOGGER.error("Quick Timer coordinator not initialized")
-            return
-        
         entity_id = call.data[ATTR_ENTITY_ID]
         preferences = call.data[ATTR_PREFERENCES]
-        _LOGGER.info("Setting preferences for %s: %s", entity_id, preferences)
-        
+        _LOGGER.debug("Setting preferences for %s: %s", entity_id, preferences)
+
         # Use coordinator's preferences_store to ensure consistency
         await coord.preferences_store.async_set_preferences(entity_id, preferences)
-        _LOGGER.info("Preferences saved, updating sensor...")
-        
+
         # Update sensor with new preferences
         coord._update_preferences_sensor()
-        _LOGGER.info("Sensor updated with new preferences")
+        _LOGGER.debug("Preferences for %s saved and sensor updated", entity_id)
 
     # Only register if not already registered
     if not hass.services.has_service(DOMAIN, SERVICE_RUN_ACTION):
@@ -1029,21 +1275,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     #Register frontend resources and dialog injection
     await async_register_frontend(hass)
 
-    # Ensure async_setup was called
-    if DOMAIN not in hass.data:
+    # Ensure async_setup ran; the coordinator itself is memoized, so this
+    # never re-loads the stores when they already exist
+    if "coordinator" not in hass.data.get(DOMAIN, {}):
         await async_setup(hass, {})
-    
-    # Initialize storage if not already done
-    if "store" not in hass.data[DOMAIN]:
-        store = QuickTimerStore(hass)
-        await store.async_load()
-        preferences_store = QuickTimerPreferencesStore(hass)
-        await preferences_store.async_load()
-        coordinator = QuickTimerCoordinator(hass, store, preferences_store)
-        hass.data[DOMAIN]["coordinator"] = coordinator
-        hass.data[DOMAIN]["store"] = store
-        hass.data[DOMAIN]["preferences_store"] = preferences_store
-        await coordinator.async_restore_tasks()
 
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -1066,11 +1301,16 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         lovelace = hass.data.get("lovelace")
         resources = getattr(lovelace, "resources", None)
         if resources:
-            # We use list() to create a copy of items for safe iteration during removal
-            for res in list(resources.async_items()):
-                if "/quick_timer_static/" in res.get("url", ""):
-                    _LOGGER.info("Removing Quick Timer Card resource: %s", res["url"])
-                    await resources.async_delete_item(res["id"])
+            # Collect just the matching ids first, then delete — no full
+            # snapshot of unrelated resources needed for safe iteration
+            to_delete = [
+                res["id"]
+                for res in resources.async_items()
+                if "/quick_timer_static/" in res.get("url", "")
+            ]
+            for res_id in to_delete:
+                _LOGGER.info("Removing Quick Timer Card resource: %s", res_id)
+                await resources.async_delete_item(res_id)
 
         # Clean up hass.data for this domain
         # hass.data[DOMAIN].pop("coordinator", None)
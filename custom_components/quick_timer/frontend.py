@@ -1,17 +1,27 @@
+import hashlib
 import logging
 import os
-import time
 import re
 from aiohttp import web
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.core import HomeAssistant
-from homeassistant.loader import async_get_integration
+from homeassistant.loader import IntegrationNotFound, async_get_integration
 
 _LOGGER = logging.getLogger(__name__)
 
 URL_BASE = "/quick_timer_static"
 FILENAME = "quick-timer-card.js"
 
+# filename -> (body bytes, etag), filled at registration so GETs are served
+# straight from memory without executor/disk round-trips
+_CARD_CACHE: dict[str, tuple[bytes, str]] = {}
+
+
+def _read_card(file_path: str) -> str:
+    """Read the card JS from disk (runs in the executor)."""
+    with open(file_path, "r", encoding="utf-8") as f:
+        return f.read()
+
 async def async_register_frontend(hass: HomeAssistant):
     """Register View and Lovelace resource."""
     
@@ -19,14 +29,40 @@ async def async_register_frontend(hass: HomeAssistant):
     hass.http.register_view(QuickTimerCardView())
 
     # Prepare URL with cache buster
+    version = "0.0.0"  # Fallback version
     try:
         integration = await async_get_integration(hass, "quick_timer")
-        version = integration.version
-    except Exception:
-        version = "0.0.0"  # Fallback version
-        
-    timestamp = int(time.time())
-    url = f"{URL_BASE}/{FILENAME}?v={version}&t={timestamp}"
+        version = integration.version or version
+    except IntegrationNotFound:
+        _LOGGER.debug("quick_timer integration not found, using fallback version")
+
+
+    # Stable cache buster: version + file mtime instead of the setup time,
+    # so restarts don't force clients to re-download an unchanged card
+    file_path = os.path.join(
+        os.path.dirname(os.path.realpath(__file__)), "www", FILENAME
+    )
+    try:
+        mtime = int(await hass.async_add_executor_job(os.path.getmtime, file_path))
+    except OSError:
+        mtime = 0
+    url = f"{URL_BASE}/{FILENAME}?v={version}&t={mtime}"
+
+    # Read the card once, inject the version constant and keep the bytes in
+    # memory; subsequent GETs are served without touching the disk.
+    try:
+        content = await hass.async_add_executor_job(_read_card, file_path)
+        content = re.sub(
+            r"const\s+CARD_VERSION\s*=\s*'[^']*';",
+            f"const CARD_VERSION = '{version}';",
+            content,
+            count=1,
+        )
+        body = content.encode("utf-8")
+        etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+        _CARD_CACHE[FILENAME] = (body, etag)
+    except OSError as err:
+        _LOGGER.error("Could not cache card JS from %s: %s", file_path, err)
 
     # Registration or update of the resource in Lovelace
     lovelace = hass.data.get("lovelace")
@@ -75,44 +111,35 @@ class QuickTimerCardView(HomeAssistantView):
         """Return the content of the JS file."""
         if filename != FILENAME:
             return web.Response(status=404, text="File not found")
-            
-        # Get the correct path
+
+        cached = _CARD_CACHE.get(filename)
+        if cached is not None:
+            body, etag = cached
+            if request.headers.get("If-None-Match") == etag:
+                return web.Response(status=304, headers={"ETag": etag})
+            return web.Response(
+                body=body,
+                headers={"ETag": etag, "Cache-Control": "public, max-age=86400"},
+                content_type="application/javascript",
+            )
+
+        # Cache miss (frontend registration hasn't run yet): stream straight
+        # from disk. FileResponse uses sendfile and handles conditional
+        # requests itself; the version constant is only injected once the
+        # cached path is populated.
         current_dir = os.path.dirname(os.path.realpath(__file__))
         file_path = os.path.join(current_dir, "www", filename)
 
         # Check existence in executor (non-blocking)
         hass = request.app["hass"]
-        if not await hass.async_add_executor_job(os.path.exists, file_path):
+        if not await hass.async_add_executor_job(os.path.isfile, file_path):
             _LOGGER.error("File does not exist at path: %s", file_path)
             return web.Response(status=404, text="File not found on disk")
 
-        # Read file in executor (non-blocking)
-        try:
-            content = await hass.async_add_executor_job(self._read_file, file_path)
-
-            # Try to determine version from integration (fallback to query param)
-            try:
-                integration = await async_get_integration(hass, "quick_timer")
-                file_version = integration.version or "0.0.0"
-            except Exception:
-                # If integration not available, try query param v
-                qv = request.query.get('v')
-                file_version = qv or "0.0.0"
-
-            # Replace CARD_VERSION in JS so frontend reflects integration version
-            try:
-                content = re.sub(r"const\s+CARD_VERSION\s*=\s*'[^']*';",
-                                 f"const CARD_VERSION = '{file_version}';",
-                                 content, count=1)
-            except Exception:
-                _LOGGER.debug("Failed to inject card version into JS; serving original file")
-
-            return web.Response(body=content, content_type="application/javascript")
-        except Exception as e:
-            _LOGGER.error("Error reading file: %s", e)
-            return web.Response(status=500, text=str(e))
-
-    def _read_file(self, file_path):
-        """Helper to read file safely in executor."""
-        with open(file_path, "r", encoding="utf-8") as f:
-            return f.read()
\ No newline at end of file
+        return web.FileResponse(
+            file_path,
+            headers={
+                "Content-Type": "application/javascript",
+                "Cache-Control": "public, max-age=86400",
+            },
+        )
\ No newline at end of file
@@ -40,29 +40,46 @@ class QuickTimerSensor(SensorEntity):
         self._attr_unique_id = "quick_timer_monitor"
         self._active_tasks: dict[str, Any] = {}
         self._preferences: dict[str, Any] = {}
+        # (options mapping, parsed presets) — see extra_state_attributes
+        self._presets_cache: tuple[Any, dict[str, Any]] | None = None
+        # True while a coalesced state write is pending on the loop
+        self._write_scheduled = False
 
     @property
     def native_value(self) -> int:
         """Return the number of active scheduled tasks."""
         return len(self._active_tasks)
 
-    def _parse_presets(self, preset_string: str) -> list[int]:
-        """Parse comma-separated preset string into list of integers."""
+    def _parse_presets(self, preset_string: str) -> tuple[int, ...]:
+        """Parse comma-separated preset string into a tuple of integers."""
         try:
-            return [int(x.strip()) for x in preset_string.split(",") if x.strip()]
+            return tuple(int(x) for x in preset_string.split(",") if x.strip())
         except (ValueError, AttributeError):
-            return []
+            return ()
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the state attributes with active task details."""
         now = dt_util.now()
+        now_ts = now.timestamp()
         tasks_with_remaining = {}
-        
+
         for task_id, task in self._active_tasks.items():
+            # Fast path: tasks store epoch timestamps at scheduling time, so
+            # rendering is plain float arithmetic with no ISO parsing
+            end_ts = task.get("end_ts")
+            if end_ts is not None:
+                entry = task.copy()
+                entry["remaining_seconds"] = max(0, int(end_ts - now_ts))
+                entry["end_timestamp"] = end_ts
+                entry["start_timestamp"] = task.get("start_ts")
+                tasks_with_remaining[task_id] = entry
+                continue
+
+            # Legacy tasks persisted before end_ts existed: parse the strings
             end_time_str = task.get("end_time") or task.get("scheduled_time")
             start_time_str = task.get("scheduled_time")  # Toto je reálny čas štartu
-            
+
             if end_time_str:
                 try:
                     end_time = dt_util.parse_datetime(end_time_str)
@@ -73,13 +90,15 @@ class QuickTimerSensor(SensorEntity):
                             start_timestamp = start_time.timestamp()
 
                     if end_time:
-                        remaining_seconds = max(0, int((end_time - now).total_seconds()))
-                        tasks_with_remaining[task_id] = {
-                            **task,
-                            "remaining_seconds": remaining_seconds,
-                            "end_timestamp": end_time.timestamp(),
-                            "start_timestamp": start_timestamp,
-                        }
+                        # copy + three assignments instead of a {**task, ...}
+                        # literal: no intermediate unpacking pass per read
+                        entry = task.copy()
+                        entry["remaining_seconds"] = max(
+                            0, int((end_time - now).total_seconds())
+                        )
+                        entry["end_timestamp"] = end_time.timestamp()
+                        entry["start_timestamp"] = start_timestamp
+                        tasks_with_remaining[task_id] = entry
                     else:
                         tasks_with_remaining[task_id] = task
                 except (ValueError, TypeError):
@@ -87,34 +106,61 @@ class QuickTimerSensor(SensorEntity):
             else:
                 tasks_with_remaining[task_id] = task
         
-        # Get presets from options
+        # Get presets from options. Options change rarely but this property
+        # is read on every state write, so cache the parsed lists keyed on
+        # the options mapping itself — config entry updates replace the
+        # mapping wholesale, which invalidates the cache by identity.
         options = self._config_entry.options
-        preset_seconds = self._parse_presets(options.get("preset_seconds", "5,10,15,20,30,45"))
-        preset_minutes = self._parse_presets(options.get("preset_minutes", "1,2,3,5,10,15,20,30,45"))
-        preset_hours = self._parse_presets(options.get("preset_hours", "1,2,3,4,6,8,12"))
-        
+        cache = self._presets_cache
+        if cache is not None and cache[0] is options:
+            presets = cache[1]
+        else:
+            presets = {
+                "seconds": self._parse_presets(options.get("preset_seconds", "5,10,15,20,30,45")),
+                "minutes": self._parse_presets(options.get("preset_minutes", "1,2,3,5,10,15,20,30,45")),
+                "hours": self._parse_presets(options.get("preset_hours", "1,2,3,4,6,8,12")),
+            }
+            self._presets_cache = (options, presets)
+
         return {
             "active_tasks": tasks_with_remaining,
             "task_count": len(self._active_tasks),
             "preferences": self._preferences,
-            "presets": {
-                "seconds": preset_seconds,
-                "minutes": preset_minutes,
-                "hours": preset_hours,
-            },
+            "presets": presets,
         }
 
+    @callback
+    def _schedule_write(self) -> None:
+        """Coalesce state writes into one per event-loop tick.
+
+        Burst updates (e.g. the coordinator restoring many tasks) would
+        otherwise push one state-machine event per task.
+        """
+        if self._write_scheduled:
+            return
+        self._write_scheduled = True
+        self.hass.loop.call_soon(self._flush_write)
+
+    @callback
+    def _flush_write(self) -> None:
+        """Perform the deferred state write."""
+        self._write_scheduled = False
+        if self.hass is None:
+            # Entity was removed before the scheduled write ran
+            return
+        self.async_write_ha_state()
+
     @callback
     def update_tasks(self, tasks: dict[str, Any]) -> None:
         """Update the active tasks."""
         self._active_tasks = tasks
-        self.async_write_ha_state()
+        self._schedule_write()
 
     @callback
     def update_preferences(self, preferences: dict[str, Any]) -> None:
         """Update the preferences."""
         self._preferences = preferences
-        self.async_write_ha_state()
+        self._schedule_write()
 
     async def async_added_to_hass(self) -> None:
         """Run when entity is added to hass."""
@@ -90,13 +90,21 @@ class QuickTimerStore:
         at_time: str | None = None,
         time_mode: str = "relative",
         task_label: str | None = None,
+        end_ts: float | None = None,
+        start_ts: float | None = None,
     ) -> None:
-        """Add a scheduled task with new architecture (task_id-based, action arrays)."""
+        """Add a scheduled task with new architecture (task_id-based, action arrays).
+
+        end_ts/start_ts are the epoch equivalents of end_time/scheduled_time,
+        stored so readers don't have to re-parse the ISO strings.
+        """
         self._data[task_id] = {
             "task_id": task_id,
             "task_label": task_label,
             "scheduled_time": scheduled_time,
             "end_time": end_time,
+            "end_ts": end_ts,
+            "start_ts": start_ts,
             "delay_seconds": delay_seconds,
             "start_actions": start_actions or [],
             "finish_actions": finish_actions or [],